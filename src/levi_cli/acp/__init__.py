@@ -6,8 +6,15 @@ def acp_main() -> None:
 
     from levi_cli.acp.server import ACPServer
     from levi_cli.app import enable_logging
+    from levi_cli.utils.aiohttp import close_shared_client_session
     from loguru import logger
 
+    async def _main() -> None:
+        try:
+            await acp.run_agent(ACPServer(), use_unstable_protocol=True)
+        finally:
+            await close_shared_client_session()
+
     enable_logging()
     logger.info("Starting ACP server on stdio")
-    asyncio.run(acp.run_agent(ACPServer(), use_unstable_protocol=True))
+    asyncio.run(_main())
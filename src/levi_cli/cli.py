@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import sys
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 import typer
 
 from levi_cli.constant import VERSION
-from levi_cli.mcp import cli as mcp_cli
 
 
 class Reload(Exception):
@@ -219,12 +217,13 @@ def levi(
 
     del version  # handled in the callback
 
-
+    import orjson
     from levi_cli.agentspec import DEFAULT_AGENT_FILE
     from levi_cli.app import LeviCLI, enable_logging
     from levi_cli.mcp import get_global_mcp_config_file
     from levi_cli.metadata import load_metadata, save_metadata
     from levi_cli.session import Session
+    from levi_cli.utils.aiohttp import close_shared_client_session
     from loguru import logger
 
     enable_logging(debug)
@@ -234,24 +233,14 @@ def levi(
         if not session_id:
             raise typer.BadParameter("Session ID cannot be empty", param_hint="--session")
 
-    conflict_option_sets = [
-        {
-            "--print": print_mode,
-            "--acp": acp_mode,
-            "--wire": wire_mode,
-        },
-        {
-            "--agent": agent is not None,
-            "--agent-file": agent_file is not None,
-        },
-        {
-            "--continue": continue_,
-            "--session": session_id is not None,
-        },
-    ]
+    conflict_option_sets = (
+        (("--print", print_mode), ("--acp", acp_mode), ("--wire", wire_mode)),
+        (("--agent", agent is not None), ("--agent-file", agent_file is not None)),
+        (("--continue", continue_), ("--session", session_id is not None)),
+    )
     for option_set in conflict_option_sets:
-        active_options = [flag for flag, active in option_set.items() if active]
-        if len(active_options) > 1:
+        if sum(active for _, active in option_set) > 1:
+            active_options = [flag for flag, active in option_set if active]
             raise typer.BadParameter(
                 f"Cannot combine {', '.join(active_options)}.",
                 param_hint=active_options[0],
@@ -287,23 +276,20 @@ def levi(
             param_hint="--output-format",
         )
 
-    file_configs = list(mcp_config_file or [])
-    raw_mcp_config = list(mcp_config or [])
-
     # Use default MCP config file if no MCP config is provided
-    if not file_configs:
+    if not mcp_config_file:
         default_mcp_file = get_global_mcp_config_file()
-        if default_mcp_file.exists():
-            file_configs.append(default_mcp_file)
+        mcp_config_file = [default_mcp_file] if default_mcp_file.exists() else []
 
+    mcp_configs: list[dict[str, Any]] = []
     try:
-        mcp_configs = [json.loads(conf.read_text(encoding="utf-8")) for conf in file_configs]
-    except json.JSONDecodeError as e:
+        mcp_configs.extend(orjson.loads(conf.read_bytes()) for conf in mcp_config_file)
+    except orjson.JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="--mcp-config-file") from e
 
     try:
-        mcp_configs += [json.loads(conf) for conf in raw_mcp_config]
-    except json.JSONDecodeError as e:
+        mcp_configs.extend(orjson.loads(conf) for conf in mcp_config or ())
+    except orjson.JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="--mcp-config") from e
 
     work_dir = local_work_dir if local_work_dir else Path.cwd()
@@ -364,18 +350,12 @@ def levi(
                 succeeded = True
 
         if succeeded:
+            # Re-read instead of reusing the copy loaded before the run: the session itself and
+            # other Levi processes may have saved metadata in the meantime.
             metadata = load_metadata()
 
             # Update work_dir metadata with last session
-            work_dir_meta = metadata.get_work_dir_meta(session.work_dir)
-
-            if work_dir_meta is None:
-                logger.warning(
-                    "Work dir metadata missing when marking last session, recreating: {work_dir}",
-                    work_dir=session.work_dir,
-                )
-                work_dir_meta = metadata.new_work_dir_meta(session.work_dir)
-
+            work_dir_meta = metadata.ensure_work_dir_meta(session.work_dir)
             work_dir_meta.last_session_id = session.id
 
             # Update thinking mode
@@ -385,16 +365,21 @@ def levi(
 
         return succeeded
 
-    while True:
+    # Keep one event loop across reloads instead of setting up a new one each time
+    with asyncio.Runner() as runner:
         try:
-            succeeded = asyncio.run(_run(session_id))
-            session_id = None
-            if not succeeded:
-                raise typer.Exit(code=1)
-            break
-        except Reload as e:
-            session_id = e.session_id
-            continue
+            while True:
+                try:
+                    succeeded = runner.run(_run(session_id))
+                    session_id = None
+                    if not succeeded:
+                        raise typer.Exit(code=1)
+                    break
+                except Reload as e:
+                    session_id = e.session_id
+                    continue
+        finally:
+            runner.run(close_shared_client_session())
 
 
 @cli.command()
@@ -405,11 +390,36 @@ def acp():
     acp_main()
 
 
-cli.add_typer(mcp_cli, name="mcp")
+@cli.command(
+    "mcp",
+    # Stop parsing at the first subcommand token, so that `--` and everything after it (e.g. the
+    # stdio server command in `levi mcp add ... -- npx -y pkg`) reach the MCP app unchanged.
+    context_settings={
+        "allow_extra_args": True,
+        "ignore_unknown_options": True,
+        "allow_interspersed_args": False,
+    },
+    add_help_option=False,
+)
+def mcp(ctx: typer.Context):
+    """Manage MCP server configurations."""
+    # Imported lazily so that non-MCP invocations don't pay for building the MCP app.
+    from levi_cli.mcp import cli as mcp_cli
+
+    mcp_cli(args=ctx.args, prog_name=ctx.command_path)
+
+
+def main() -> None:
+    """Entry point of the `levi` command."""
+    # Answer `levi --version` without letting Typer build the whole command tree
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        typer.echo(f"levi, version {VERSION}")
+        return
+    cli()
 
 
 if __name__ == "__main__":
     if "levi_cli.cli" not in sys.modules:
         sys.modules["levi_cli.cli"] = sys.modules[__name__]
 
-    sys.exit(cli())
+    sys.exit(main())
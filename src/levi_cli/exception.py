@@ -4,16 +4,16 @@ from __future__ import annotations
 class LeviCLIException(Exception):
     """Base exception class for Levi CLI."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigError(LeviCLIException):
     """Configuration error."""
 
-    pass
+    __slots__ = ()
 
 
 class AgentSpecError(LeviCLIException):
     """Agent specification error."""
 
-    pass
+    __slots__ = ()
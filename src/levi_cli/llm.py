@@ -10,6 +10,8 @@ from pydantic import SecretStr
 from levi_cli.constant import USER_AGENT
 
 if TYPE_CHECKING:
+    from kosong.chat_provider.chaos import ChaosConfig
+
     from levi_cli.config import LLMModel, LLMProvider
 
 type ProviderType = Literal[
@@ -20,7 +22,18 @@ type ProviderType = Literal[
 ]
 
 type ModelCapability = Literal["image_in", "thinking"]
-ALL_MODEL_CAPABILITIES: set[ModelCapability] = set(get_args(ModelCapability.__value__))
+ALL_MODEL_CAPABILITIES: frozenset[ModelCapability] = frozenset(("image_in", "thinking"))
+assert frozenset(get_args(ModelCapability.__value__)) == ALL_MODEL_CAPABILITIES
+
+# provider type -> (provider env prefix, model env prefix)
+_ENV_PREFIXES: dict[str, tuple[str, str]] = {
+    "qwen": ("DASHSCOPE", "QWEN"),
+    "deepseek": ("DEEPSEEK", "DEEPSEEK"),
+    "local": ("LOCAL", "LOCAL"),
+}
+
+_THINKING_KEYWORDS = ("thinking", "reasoning", "reasoner", "r1")
+_IMAGE_KEYWORDS = ("vl", "vision", "multimodal", "mm")
 
 
 @dataclass(slots=True)
@@ -42,72 +55,29 @@ def augment_provider_with_env_vars(provider: LLMProvider, model: LLMModel) -> di
     """
     applied: dict[str, str] = {}
 
-    match provider.type:
-        case "qwen":
-            if base_url := os.getenv("DASHSCOPE_BASE_URL"):
-                provider.base_url = base_url
-                applied["DASHSCOPE_BASE_URL"] = base_url
-            if api_key := os.getenv("DASHSCOPE_API_KEY"):
-                provider.api_key = SecretStr(api_key)
-                applied["DASHSCOPE_API_KEY"] = "******"
-            if model_name := os.getenv("QWEN_MODEL_NAME"):
-                model.model = model_name
-                applied["QWEN_MODEL_NAME"] = model_name
-            if max_context_size := os.getenv("QWEN_MODEL_MAX_CONTEXT_SIZE"):
-                model.max_context_size = int(max_context_size)
-                applied["QWEN_MODEL_MAX_CONTEXT_SIZE"] = max_context_size
-            if capabilities := os.getenv("QWEN_MODEL_CAPABILITIES"):
-                caps_lower = (cap.strip().lower() for cap in capabilities.split(",") if cap.strip())
-                model.capabilities = set(
-                    cast(ModelCapability, cap)
-                    for cap in caps_lower
-                    if cap in get_args(ModelCapability)
-                )
-                applied["QWEN_MODEL_CAPABILITIES"] = capabilities
-        case "deepseek":
-            if base_url := os.getenv("DEEPSEEK_BASE_URL"):
-                provider.base_url = base_url
-                applied["DEEPSEEK_BASE_URL"] = base_url
-            if api_key := os.getenv("DEEPSEEK_API_KEY"):
-                provider.api_key = SecretStr(api_key)
-                applied["DEEPSEEK_API_KEY"] = "******"
-            if model_name := os.getenv("DEEPSEEK_MODEL_NAME"):
-                model.model = model_name
-                applied["DEEPSEEK_MODEL_NAME"] = model_name
-            if max_context_size := os.getenv("DEEPSEEK_MODEL_MAX_CONTEXT_SIZE"):
-                model.max_context_size = int(max_context_size)
-                applied["DEEPSEEK_MODEL_MAX_CONTEXT_SIZE"] = max_context_size
-            if capabilities := os.getenv("DEEPSEEK_MODEL_CAPABILITIES"):
-                caps_lower = (cap.strip().lower() for cap in capabilities.split(",") if cap.strip())
-                model.capabilities = set(
-                    cast(ModelCapability, cap)
-                    for cap in caps_lower
-                    if cap in get_args(ModelCapability)
-                )
-                applied["DEEPSEEK_MODEL_CAPABILITIES"] = capabilities
-        case "local":
-            if base_url := os.getenv("LOCAL_BASE_URL"):
-                provider.base_url = base_url
-                applied["LOCAL_BASE_URL"] = base_url
-            if api_key := os.getenv("LOCAL_API_KEY"):
-                provider.api_key = SecretStr(api_key)
-                applied["LOCAL_API_KEY"] = "******"
-            if model_name := os.getenv("LOCAL_MODEL_NAME"):
-                model.model = model_name
-                applied["LOCAL_MODEL_NAME"] = model_name
-            if max_context_size := os.getenv("LOCAL_MODEL_MAX_CONTEXT_SIZE"):
-                model.max_context_size = int(max_context_size)
-                applied["LOCAL_MODEL_MAX_CONTEXT_SIZE"] = max_context_size
-            if capabilities := os.getenv("LOCAL_MODEL_CAPABILITIES"):
-                caps_lower = (cap.strip().lower() for cap in capabilities.split(",") if cap.strip())
-                model.capabilities = set(
-                    cast(ModelCapability, cap)
-                    for cap in caps_lower
-                    if cap in get_args(ModelCapability)
-                )
-                applied["LOCAL_MODEL_CAPABILITIES"] = capabilities
-        case _:
-            pass
+    prefixes = _ENV_PREFIXES.get(provider.type)
+    if prefixes is None:
+        return applied
+    provider_prefix, model_prefix = prefixes
+
+    if base_url := os.getenv(env := f"{provider_prefix}_BASE_URL"):
+        provider.base_url = base_url
+        applied[env] = base_url
+    if api_key := os.getenv(env := f"{provider_prefix}_API_KEY"):
+        provider.api_key = SecretStr(api_key)
+        applied[env] = "******"
+    if model_name := os.getenv(env := f"{model_prefix}_MODEL_NAME"):
+        model.model = model_name
+        applied[env] = model_name
+    if max_context_size := os.getenv(env := f"{model_prefix}_MODEL_MAX_CONTEXT_SIZE"):
+        model.max_context_size = int(max_context_size)
+        applied[env] = max_context_size
+    if capabilities := os.getenv(env := f"{model_prefix}_MODEL_CAPABILITIES"):
+        caps_lower = (cap.strip().lower() for cap in capabilities.split(","))
+        model.capabilities = {
+            cast(ModelCapability, cap) for cap in caps_lower if cap in ALL_MODEL_CAPABILITIES
+        }
+        applied[env] = capabilities
 
     return applied
 
@@ -118,44 +88,18 @@ def create_llm(
     *,
     session_id: str | None = None,
 ) -> LLM:
-    match provider.type:
-        case "qwen":
-            from kosong.contrib.chat_provider.openai_legacy import OpenAILegacy
-            chat_provider = OpenAILegacy(
-                model=model.model,
-                base_url=provider.base_url,
-                api_key=provider.api_key.get_secret_value(),
-            )
-        case "deepseek":
-            from kosong.contrib.chat_provider.openai_legacy import OpenAILegacy
-
-            chat_provider = OpenAILegacy(
-                model=model.model,
-                base_url=provider.base_url,
-                api_key=provider.api_key.get_secret_value(),
-            )
-        case "local":
-            from kosong.contrib.chat_provider.openai_legacy import OpenAILegacy
-
-            chat_provider = OpenAILegacy(
-                model=model.model,
-                base_url=provider.base_url,
-                api_key=provider.api_key.get_secret_value(),
-            )
-        case "_chaos":
-            from kosong.chat_provider.chaos import ChaosChatProvider, ChaosConfig
-            from kosong.contrib.chat_provider.openai_legacy import OpenAILegacy
-            chat_provider = ChaosChatProvider(
-                provider=OpenAILegacy(
-                    model=model.model,
-                    base_url=provider.base_url,
-                    api_key=provider.api_key.get_secret_value(),
-                ),
-                chaos_config=ChaosConfig(
-                    error_probability=0.8,
-                    error_types=[429, 500, 503],
-                ),
-            )
+    from kosong.contrib.chat_provider.openai_legacy import OpenAILegacy
+
+    # All provider types currently speak the OpenAI-compatible chat completions API
+    chat_provider: ChatProvider = OpenAILegacy(
+        model=model.model,
+        base_url=provider.base_url,
+        api_key=provider.api_key.get_secret_value(),
+    )
+    if provider.type == "_chaos":
+        from kosong.chat_provider.chaos import ChaosChatProvider
+
+        chat_provider = ChaosChatProvider(provider=chat_provider, chaos_config=_get_chaos_config())
 
     return LLM(
         chat_provider=chat_provider,
@@ -164,19 +108,37 @@ def create_llm(
     )
 
 
+_chaos_config: ChaosConfig | None = None
+
+
+def _get_chaos_config() -> ChaosConfig:
+    """Get the shared config of the `_chaos` provider, building it on first use.
+
+    The error probability can be tuned with the `CHAOS_ERROR_PROBABILITY` environment variable,
+    the same one `ChaosConfig.from_env` reads.
+    """
+    global _chaos_config
+    if _chaos_config is None:
+        from kosong.chat_provider.chaos import ChaosConfig
+
+        _chaos_config = ChaosConfig(
+            error_probability=float(os.getenv("CHAOS_ERROR_PROBABILITY", "0.8")),
+            error_types=[429, 500, 503],
+        )
+    return _chaos_config
+
+
 def _derive_capabilities(model: LLMModel) -> set[ModelCapability]:
-    capabilities = model.capabilities or set()
-    
+    # Copy so that auto-detected capabilities don't leak back into the model config
+    capabilities: set[ModelCapability] = set(model.capabilities or ())
     model_name_lower = model.model.lower()
-    
+
     # Auto-detect thinking/reasoning capability from model name
-    thinking_keywords = ["thinking", "reasoning", "reasoner", "r1"]
-    if any(keyword in model_name_lower for keyword in thinking_keywords):
+    if any(keyword in model_name_lower for keyword in _THINKING_KEYWORDS):
         capabilities.add("thinking")
-    
+
     # Auto-detect image capability from model name
-    image_keywords = ["vl", "vision", "multimodal", "mm"]
-    if any(keyword in model_name_lower for keyword in image_keywords):
+    if any(keyword in model_name_lower for keyword in _IMAGE_KEYWORDS):
         capabilities.add("image_in")
-    
+
     return capabilities
@@ -1,10 +1,14 @@
-import json
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
+import orjson
 import typer
 
-cli = typer.Typer(help="Manage MCP server configurations.")
+cli = typer.Typer(
+    add_completion=False,
+    context_settings={"help_option_names": ["-h", "--help"]},
+    help="Manage MCP server configurations.",
+)
 
 
 def get_global_mcp_config_file() -> Path:
@@ -20,15 +24,15 @@ def _load_mcp_config() -> dict[str, Any]:
     if not mcp_file.exists():
         return {"mcpServers": {}}
     try:
-        return json.loads(mcp_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        return orjson.loads(mcp_file.read_bytes())
+    except orjson.JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON in MCP config file '{mcp_file}': {e}") from e
 
 
 def _save_mcp_config(config: dict[str, Any]) -> None:
     """Save MCP config to default file."""
     mcp_file = get_global_mcp_config_file()
-    mcp_file.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8")
+    mcp_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
 
 def _parse_key_value_pairs(
@@ -37,13 +41,13 @@ def _parse_key_value_pairs(
     """Parse key/value pairs from CLI options."""
     parsed: dict[str, str] = {}
     for item in items:
-        if separator not in item:
+        key, sep, value = item.partition(separator)
+        if not sep:
             typer.echo(
                 f"Invalid {option_name} format: {item} (expected KEY{separator}VALUE).",
                 err=True,
             )
             raise typer.Exit(code=1)
-        key, value = item.split(separator, 1)
         if strip_whitespace:
             key, value = key.strip(), value.strip()
         if not key:
@@ -172,6 +176,19 @@ def mcp_remove(
     typer.echo(f"Removed MCP server '{name}' from {get_global_mcp_config_file()}.")
 
 
+def _format_server(name: str, server: dict[str, Any]) -> str:
+    """Format a single MCP server entry for `mcp list`."""
+    if "command" in server:
+        cmd_args = " ".join(server.get("args", []))
+        return f"{name} (stdio): {server['command']} {cmd_args}".rstrip()
+    if "url" in server:
+        transport = server.get("transport") or "http"
+        if transport == "streamable-http":
+            transport = "http"
+        return f"{name} ({transport}): {server['url']}"
+    return f"{name}: {server}"
+
+
 @cli.command("list")
 def mcp_list():
     """List all MCP servers."""
@@ -179,21 +196,9 @@ def mcp_list():
     config = _load_mcp_config()
     servers: dict[str, Any] = config.get("mcpServers", {})
 
-    typer.echo(f"MCP config file: {config_file}")
-    if not servers:
-        typer.echo("No MCP servers configured.")
-        return
-
-    for name, server in servers.items():
-        if "command" in server:
-            cmd = server["command"]
-            cmd_args = " ".join(server.get("args", []))
-            line = f"{name} (stdio): {cmd} {cmd_args}".rstrip()
-        elif "url" in server:
-            transport = server.get("transport") or "http"
-            if transport == "streamable-http":
-                transport = "http"
-            line = f"{name} ({transport}): {server['url']}"
-        else:
-            line = f"{name}: {server}"
-        typer.echo(f"  {line}")
+    lines = [f"MCP config file: {config_file}"]
+    if servers:
+        lines.extend(f"  {_format_server(name, server)}" for name, server in servers.items())
+    else:
+        lines.append("No MCP servers configured.")
+    typer.echo("\n".join(lines))
@@ -54,6 +54,10 @@ class Metadata(BaseModel):
         self.work_dirs.append(wd_meta)
         return wd_meta
 
+    def ensure_work_dir_meta(self, path: Path) -> WorkDirMeta:
+        """Get the metadata for a work directory, creating it if missing."""
+        return self.get_work_dir_meta(path) or self.new_work_dir_meta(path)
+
 
 def load_metadata() -> Metadata:
     metadata_file = get_metadata_file()
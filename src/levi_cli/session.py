@@ -86,9 +86,7 @@ class Session:
         logger.debug("Creating new session for work directory: {work_dir}", work_dir=work_dir)
 
         metadata = load_metadata()
-        work_dir_meta = metadata.get_work_dir_meta(work_dir)
-        if work_dir_meta is None:
-            work_dir_meta = metadata.new_work_dir_meta(work_dir)
+        work_dir_meta = metadata.ensure_work_dir_meta(work_dir)
 
         session_id = str(uuid.uuid4())
         session_dir = work_dir_meta.sessions_dir / session_id
@@ -14,6 +14,8 @@ class TimeMachineError(Exception):
 
 
 class TimeMachine:
+    __slots__ = ("_pending_tmail", "_n_checkpoints")
+
     def __init__(self):
         self._pending_tmail: TMail | None = None
         self._n_checkpoints: int = 0
@@ -22,8 +24,7 @@ class TimeMachine:
         """Send a T-Mail. Intended to be called by the SendTMail tool."""
         if self._pending_tmail is not None:
             raise TimeMachineError("Only one T-Mail can be sent at a time")
-        if tmail.checkpoint_id < 0:
-            raise TimeMachineError("The checkpoint ID can not be negative")
+        # `TMail.checkpoint_id` is validated to be non-negative by pydantic
         if tmail.checkpoint_id >= self._n_checkpoints:
             raise TimeMachineError("There is no checkpoint with the given ID")
         self._pending_tmail = tmail
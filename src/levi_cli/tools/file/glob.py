@@ -1,13 +1,17 @@
 """Glob tool implementation."""
 
+import asyncio
+import fnmatch
+import functools
+import heapq
+import os
+import re
+import stat
 from pathlib import Path
 from typing import override
 
-import aiofiles.os
-import aiofiles.ospath
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
-from regex import match
 
 from levi_cli.soul.agent import BuiltinSystemPromptArgs
 from levi_cli.tools.utils import load_desc
@@ -15,6 +19,131 @@ from levi_cli.utils.path import is_within_directory, list_directory
 
 MAX_MATCHES = 1000
 
+_MAGIC_CHARS = frozenset("*?[")
+_SEP_PATTERN = re.compile(r"[\\/]" if os.name == "nt" else "/")
+_CASE_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _scandir_glob(root: str, pattern: str, include_dirs: bool) -> list[str]:
+    """
+    Match a relative glob pattern under `root` by walking it with `os.scandir`.
+
+    This follows `Path.glob` semantics: `*` also matches hidden entries, `**` matches zero or
+    more directories without following symlinks, a trailing `**` matches everything below, and
+    a trailing separator matches directories only. Unlike `Path.glob`, no `Path` object is
+    created per entry and the type checks reuse the information cached on each `DirEntry`.
+
+    Returns:
+        list[str]: Matched paths, relative to `root`.
+
+    Raises:
+        FileNotFoundError: If `root` does not exist.
+        NotADirectoryError: If `root` is not a directory.
+    """
+    if not stat.S_ISDIR(os.stat(root).st_mode):
+        raise NotADirectoryError(root)
+    parts, regexes, dirs_only = _compile_pattern(pattern)
+    if dirs_only and not include_dirs:
+        return []
+
+    last_index = len(parts) - 1
+    matches: list[str] = []
+    # Each item is an absolute path to visit, the same path relative to `root` and the index of
+    # the pattern part to match against its children
+    stack: list[tuple[str, str, int]] = [(root, "", 0)]
+    while stack:
+        path, rel_path, index = stack.pop()
+        part = parts[index]
+        is_last = index == last_index
+
+        if part == "**":
+            entries = _scandir(path)
+            if entries is None:
+                continue
+            if is_last:
+                # Trailing `**` matches the directory itself and everything below it. The root
+                # itself is reported as `.`, like `Path.relative_to` does.
+                if include_dirs:
+                    matches.append(rel_path or ".")
+            else:
+                stack.append((path, rel_path, index + 1))
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, os.path.join(rel_path, entry.name), index))
+                elif is_last and not dirs_only and (include_dirs or entry.is_file()):
+                    matches.append(os.path.join(rel_path, entry.name))
+            continue
+
+        regex = regexes[index]
+        if regex is None:
+            child = os.path.join(path, part)
+            if not is_last:
+                stack.append((child, os.path.join(rel_path, part), index + 1))
+            elif _matches_type(child, dirs_only, include_dirs):
+                matches.append(os.path.join(rel_path, part))
+            continue
+
+        for entry in _scandir(path) or ():
+            if not regex.match(entry.name):
+                continue
+            if not is_last:
+                if entry.is_dir():
+                    stack.append((entry.path, os.path.join(rel_path, entry.name), index + 1))
+            elif entry.is_dir() if dirs_only else (include_dirs or entry.is_file()):
+                matches.append(os.path.join(rel_path, entry.name))
+
+    return matches
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(
+    pattern: str,
+) -> tuple[tuple[str, ...], tuple[re.Pattern[str] | None, ...], bool]:
+    """
+    Split a glob pattern into its parts and compile the wildcard ones. The result is cached, as
+    the same patterns tend to be used again and again.
+
+    Returns:
+        tuple: The parts, their compiled regexes (`None` for `**` and literal names) and whether
+            the pattern matches directories only.
+    """
+    if os.path.isabs(pattern):
+        raise ValueError("Non-relative patterns are unsupported")
+
+    dirs_only = _SEP_PATTERN.match(pattern[-1:]) is not None
+    parts: list[str] = []
+    for part in _SEP_PATTERN.split(pattern):
+        if part in ("", ".") or (part == "**" and parts and parts[-1] == "**"):
+            continue
+        parts.append(part)
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    regexes = tuple(
+        None
+        if part == "**" or _MAGIC_CHARS.isdisjoint(part)
+        else re.compile(fnmatch.translate(part), _CASE_FLAGS)
+        for part in parts
+    )
+    return tuple(parts), regexes, dirs_only
+
+
+def _scandir(path: str) -> list[os.DirEntry[str]] | None:
+    """List a directory, or return `None` if it is missing or unreadable."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return None
+
+
+def _matches_type(path: str, dirs_only: bool, include_dirs: bool) -> bool:
+    if dirs_only:
+        return os.path.isdir(path)
+    if include_dirs:
+        return os.path.lexists(path)
+    return os.path.isfile(path)
+
 
 class Params(BaseModel):
     pattern: str = Field(description=("Glob pattern to match files/directories."))
@@ -100,51 +229,41 @@ class Glob(CallableTool2[Params]):
             if dir_error:
                 return dir_error
 
-            if not await aiofiles.os.path.exists(dir_path):
+            # Perform the glob search - users can use ** directly in pattern. The directory
+            # checks and filtering happen in the same worker thread to save thread hops.
+            try:
+                matches = await asyncio.to_thread(
+                    _scandir_glob, str(dir_path), params.pattern, params.include_dirs
+                )
+            except FileNotFoundError:
                 return ToolError(
                     message=f"`{params.directory}` does not exist.",
                     brief="Directory not found",
                 )
-            if not await aiofiles.os.path.isdir(dir_path):
+            except NotADirectoryError:
                 return ToolError(
                     message=f"`{params.directory}` is not a directory.",
                     brief="Invalid directory",
                 )
 
-            # Perform the glob search - users can use ** directly in pattern
-            import asyncio
-            matches = await asyncio.to_thread(
-    lambda: list(dir_path.glob(params.pattern))
-)
-            for match in dir_path.glob(params.pattern):  
-                matches.append(match)
-
-            # Filter out directories if not requested
-            if not params.include_dirs:
-    # 需要用循环而不是列表推导式
-                filtered_matches = []
-                for p in matches:
-                    if await aiofiles.os.path.isfile(p):
-                        filtered_matches.append(p)
-                matches = filtered_matches
-            # Sort for consistent output
-            matches.sort()
-
-            # Limit matches
+            # Limit matches, keeping the output sorted for consistency
+            n_matches = len(matches)
             message = (
-                f"Found {len(matches)} matches for pattern `{params.pattern}`."
-                if len(matches) > 0
+                f"Found {n_matches} matches for pattern `{params.pattern}`."
+                if n_matches > 0
                 else f"No matches found for pattern `{params.pattern}`."
             )
-            if len(matches) > MAX_MATCHES:
-                matches = matches[:MAX_MATCHES]
+            if n_matches > MAX_MATCHES:
+                matches = heapq.nsmallest(MAX_MATCHES, matches)
                 message += (
                     f" Only the first {MAX_MATCHES} matches are returned. "
                     "You may want to use a more specific pattern."
                 )
+            else:
+                matches.sort()
 
             return ToolOk(
-                output="\n".join(str(p.relative_to(dir_path)) for p in matches),
+                output="\n".join(matches),
                 message=message,
             )
 
@@ -3,12 +3,15 @@ The local version of the Grep tool using ripgrep.
 Requires ripgrep to be installed system-wide.
 """
 
+import asyncio
+import os
 import platform
 import shutil
+import stat
+import time
 from pathlib import Path
 from typing import override
 
-import ripgrepy  # pyright: ignore[reportMissingTypeStubs]
 from kosong.tooling import CallableTool2, ToolError, ToolReturnValue
 from pydantic import BaseModel, Field
 
@@ -16,6 +19,15 @@ from levi_cli.tools.utils import ToolResultBuilder, load_desc
 from loguru import logger
 
 
+DEFAULT_MAX_COLUMNS = 1000
+"""Lines longer than this many bytes are only previewed when `max_columns` is not given."""
+_READ_CHUNK_SIZE = 64 * 1024
+_RG_RECHECK_INTERVAL = 60.0
+"""Seconds to wait before looking for ripgrep again after it was not found."""
+_MMAP_MIN_FILE_SIZE = 16 * 1024 * 1024
+"""Single files at least this large are searched with `--mmap`, smaller ones with `--no-mmap`."""
+
+
 class Params(BaseModel):
     pattern: str = Field(
         description="The regular expression pattern to search for in file contents"
@@ -35,7 +47,8 @@ class Params(BaseModel):
     )
     output_mode: str = Field(
         description=(
-            "`content`: Show matching lines (supports `-B`, `-A`, `-C`, `-n`, `head_limit`); "
+            "`content`: Show matching lines "
+            "(supports `-B`, `-A`, `-C`, `-n`, `head_limit`, `max_columns`); "
             "`files_with_matches`: Show file paths (supports `head_limit`); "
             "`count_matches`: Show total number of matches. "
             "Defaults to `files_with_matches`."
@@ -102,6 +115,89 @@ class Params(BaseModel):
         ),
         default=False,
     )
+    max_columns: int | None = Field(
+        description=(
+            "Lines longer than this many bytes are replaced with a preview of their first "
+            "`max_columns` bytes (the `--max-columns` and `--max-columns-preview` options). "
+            f"Requires `output_mode` to be `content`. Defaults to {DEFAULT_MAX_COLUMNS}."
+        ),
+        default=None,
+    )
+
+
+def _build_rg_argv(params: Params, rg_path: str, use_mmap: bool = False) -> list[str]:
+    """Build the ripgrep command line for the given parameters."""
+    argv = [rg_path]
+
+    # Search options
+    argv.append("--mmap" if use_mmap else "--no-mmap")
+    if params.ignore_case:
+        argv.append("--ignore-case")
+    if params.multiline:
+        argv += ["--multiline", "--multiline-dotall"]
+
+    # Content display options (only for content mode)
+    if params.output_mode == "content":
+        if params.before_context is not None:
+            argv += ["--before-context", str(params.before_context)]
+        if params.after_context is not None:
+            argv += ["--after-context", str(params.after_context)]
+        if params.context is not None:
+            argv += ["--context", str(params.context)]
+        if params.line_number:
+            argv.append("--line-number")
+        # Keep minified files and the like from flooding the output with huge lines
+        max_columns = DEFAULT_MAX_COLUMNS if params.max_columns is None else params.max_columns
+        argv += ["--max-columns", str(max_columns), "--max-columns-preview"]
+        if params.head_limit is not None and params.head_limit > 0:
+            # No file can contribute more than head_limit matches to the first head_limit lines
+            argv += ["--max-count", str(params.head_limit)]
+
+    # File filtering options
+    if params.glob:
+        argv += ["--glob", params.glob]
+    if params.type:
+        argv += ["--type", params.type]
+
+    # Output mode
+    if params.output_mode == "files_with_matches":
+        argv.append("--files-with-matches")
+    elif params.output_mode == "count_matches":
+        argv.append("--count-matches")
+
+    argv += ["--regexp", params.pattern, "--", os.path.expanduser(params.path)]
+    return argv
+
+
+def _is_large_file(path: str) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size >= _MMAP_MIN_FILE_SIZE
+
+
+async def _read_head(stream: asyncio.StreamReader, max_lines: int) -> tuple[bytes, bool]:
+    """
+    Read `stream` until EOF or until `max_lines` complete lines have been read.
+
+    Returns the bytes read (up to and including the last newline when stopped early) and
+    whether the read stopped before EOF.
+    """
+    buf = bytearray()
+    n_lines = 0
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        n_chunk_lines = chunk.count(b"\n")
+        if n_lines + n_chunk_lines < max_lines:
+            buf += chunk
+            n_lines += n_chunk_lines
+            continue
+        end = -1
+        for _ in range(max_lines - n_lines):
+            end = chunk.index(b"\n", end + 1)
+        buf += chunk[: end + 1]
+        return bytes(buf), True
+    return bytes(buf), False
 
 
 class Grep(CallableTool2[Params]):
@@ -114,13 +210,16 @@ class Grep(CallableTool2[Params]):
     # 类级别缓存，避免重复查找 ripgrep
     _rg_path_cache: str | None = None
     _rg_check_error: RuntimeError | None = None
+    _rg_check_time: float = 0.0
+    _rg_lock = asyncio.Lock()
 
     @classmethod
-    def _ensure_rg_available(cls) -> str:
+    async def _ensure_rg_available(cls) -> str:
         """
         确保 ripgrep 可用，结果会被缓存。
         
-        首次调用时会检查系统 PATH，之后直接返回缓存结果。
+        首次调用时会检查系统 PATH，之后直接返回缓存结果。并发调用时只会查找一次；
+        查找失败的结果只缓存 `_RG_RECHECK_INTERVAL` 秒，以便在会话中途安装 ripgrep。
         
         Returns:
             ripgrep 的完整路径
@@ -128,22 +227,37 @@ class Grep(CallableTool2[Params]):
         Raises:
             RuntimeError: 如果 ripgrep 未安装
         """
-        # 如果之前已经检查过并失败，直接抛出相同错误
-        if cls._rg_check_error is not None:
-            raise cls._rg_check_error
-        
         # 如果已经缓存了路径，直接返回
         if cls._rg_path_cache is not None:
             return cls._rg_path_cache
 
-        # 首次调用，开始查找
-        rg_path = shutil.which("rg")
-        if rg_path:
-            cls._rg_path_cache = rg_path
-            logger.info("Ripgrep found at: {path}", path=rg_path)
-            return rg_path
+        async with cls._rg_lock:
+            # 等锁期间可能已经有其他调用找到了 ripgrep
+            if cls._rg_path_cache is not None:
+                return cls._rg_path_cache
+
+            # 如果最近检查过并失败，直接抛出相同错误
+            if (
+                cls._rg_check_error is not None
+                and time.monotonic() - cls._rg_check_time < _RG_RECHECK_INTERVAL
+            ):
+                raise cls._rg_check_error
 
-        # 没找到，生成友好的错误信息
+            # 开始查找
+            cls._rg_check_time = time.monotonic()
+            rg_path = shutil.which("rg")
+            if rg_path:
+                cls._rg_path_cache = rg_path
+                cls._rg_check_error = None
+                logger.info("Ripgrep found at: {path}", path=rg_path)
+                return rg_path
+
+            cls._rg_check_error = cls._rg_not_found_error()
+            raise cls._rg_check_error
+
+    @staticmethod
+    def _rg_not_found_error() -> RuntimeError:
+        """生成友好的 ripgrep 未安装错误信息。"""
         system = platform.system()
         install_instructions = {
             "Darwin": "brew install ripgrep",
@@ -168,9 +282,7 @@ class Grep(CallableTool2[Params]):
             f"Official docs: https://github.com/BurntSushi/ripgrep#installation"
         )
         
-        error = RuntimeError(error_msg)
-        cls._rg_check_error = error
-        raise error
+        return RuntimeError(error_msg)
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
@@ -179,44 +291,37 @@ class Grep(CallableTool2[Params]):
             message = ""
 
             # 获取 ripgrep 路径（第一次查找，后续使用缓存）
-            rg_path = self._ensure_rg_available()
+            rg_path = await self._ensure_rg_available()
             logger.debug("Using ripgrep binary: {rg_bin}", rg_bin=rg_path)
 
-            # Initialize ripgrep with pattern and path
-            rg = ripgrepy.Ripgrepy(params.pattern, params.path, rg_path=rg_path)
-
-            # Apply search options
-            if params.ignore_case:
-                rg = rg.ignore_case()
-            if params.multiline:
-                rg = rg.multiline().multiline_dotall()
-
-            # Content display options (only for content mode)
-            if params.output_mode == "content":
-                if params.before_context is not None:
-                    rg = rg.before_context(params.before_context)
-                if params.after_context is not None:
-                    rg = rg.after_context(params.after_context)
-                if params.context is not None:
-                    rg = rg.context(params.context)
-                if params.line_number:
-                    rg = rg.line_number()
-
-            # File filtering options
-            if params.glob:
-                rg = rg.glob(params.glob)
-            if params.type:
-                rg = rg.type_(params.type)
-
-            # Set output mode
-            if params.output_mode == "files_with_matches":
-                rg = rg.files_with_matches()
-            elif params.output_mode == "count_matches":
-                rg = rg.count_matches()
-
             # Execute search
-            result = rg.run(universal_newlines=False)
-            output = result.as_string
+            # Memory maps pay off for linear scans of a single large file (recent ripgrep
+            # versions also advise the kernel of sequential access), but cost more than plain
+            # reads on small files
+            path = os.path.expanduser(params.path)
+            use_mmap = await asyncio.to_thread(_is_large_file, path)
+            argv = _build_rg_argv(params, rg_path, use_mmap)
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            if params.head_limit is not None and params.head_limit > 0:
+                # Stop reading (and kill rg) once we have enough lines, like `| head -N`
+                assert proc.stdout is not None and proc.stderr is not None
+                stderr_task = asyncio.create_task(proc.stderr.read())
+                stdout, stopped_early = await _read_head(proc.stdout, params.head_limit)
+                if stopped_early:
+                    proc.kill()
+                stderr = await stderr_task
+                await proc.wait()
+            else:
+                stdout, stderr = await proc.communicate()
+                stopped_early = False
+            # rg exits 1 on no match and 2 on errors; surface stderr in both cases
+            output = (stdout if stopped_early or proc.returncode == 0 else stderr).decode(
+                "utf-8", errors="replace"
+            )
 
             # Apply head limit if specified
             if params.head_limit is not None:
@@ -1,8 +1,8 @@
+import asyncio
 from pathlib import Path
 from typing import Literal, override
-import aiofiles
-import aiofiles.os
 
+import aiofiles.os
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,14 @@ from levi_cli.tools.utils import ToolRejectedError, load_desc
 from levi_cli.utils.path import is_within_directory
 
 
+def _sync_write(path: Path, content: str, mode: Literal["overwrite", "append"]) -> int:
+    """Write `content` to `path` and return the resulting file size in bytes."""
+    with open(path, "w" if mode == "overwrite" else "a", encoding="utf-8") as f:
+        f.write(content)
+        # Both modes leave the position at the end of the file, so no extra stat is needed
+        return f.tell()
+
+
 class Params(BaseModel):
     path: str = Field(description="The absolute path to the file to write")
     content: str = Field(description="The content to write to the file")
@@ -74,22 +82,14 @@ class WriteFile(CallableTool2[Params]):
             if path_error:
                 return path_error
 
+            # Fail before asking for approval, rather than having the user approve a write that
+            # cannot succeed
             if not await aiofiles.os.path.exists(p.parent):
                 return ToolError(
                     message=f"`{params.path}` parent directory does not exist.",
                     brief="Parent directory not found",
                 )
 
-            # Validate mode parameter
-            if params.mode not in ["overwrite", "append"]:
-                return ToolError(
-                    message=(
-                        f"Invalid write mode: `{params.mode}`. "
-                        "Mode must be either `overwrite` or `append`."
-                    ),
-                    brief="Invalid write mode",
-                )
-
             # Request approval
             if not await self._approval.request(
                 self.name,
@@ -98,17 +98,16 @@ class WriteFile(CallableTool2[Params]):
             ):
                 return ToolRejectedError()
 
-            # Write content to file
-            match params.mode:
-                case "overwrite":
-                    async with aiofiles.open(p, 'w', encoding='utf-8') as f:
-                        await f.write(params.content)
-                case "append":
-                    async with aiofiles.open(p, 'a', encoding='utf-8') as f:
-                        await f.write(params.content)
-            # Get file info for success message
-            file_stat = await aiofiles.os.stat(p)
-            file_size = file_stat.st_size
+            # Write content to file and get its size in one thread hop, instead of one per
+            # open/write/close/stat as with aiofiles. The parent directory may still have been
+            # removed while waiting for approval, which shows up as FileNotFoundError.
+            try:
+                file_size = await asyncio.to_thread(_sync_write, p, params.content, params.mode)
+            except FileNotFoundError:
+                return ToolError(
+                    message=f"`{params.path}` parent directory does not exist.",
+                    brief="Parent directory not found",
+                )
             action = "overwritten" if params.mode == "overwrite" else "appended to"
             return ToolOk(
                 output="",
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import override
 
@@ -9,9 +10,13 @@ from pydantic import BaseModel, Field
 from levi_cli.constant import USER_AGENT
 from levi_cli.soul.toolset import get_current_tool_call_or_none
 from levi_cli.tools.utils import ToolResultBuilder, load_desc
-from levi_cli.utils.aiohttp import new_client_session
+from levi_cli.utils.aiohttp import get_shared_client_session
 from loguru import logger
 
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+"""Response bodies are cut off after this many bytes."""
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 class Params(BaseModel):
     url: str = Field(description="The URL to fetch content from.")
@@ -34,18 +39,16 @@ class FetchURL(CallableTool2[Params]):
     async def fetch_with_http_get(params: Params) -> ToolReturnValue:
         builder = ToolResultBuilder(max_line_length=None)
         try:
-            async with (
-                new_client_session() as session,
-                session.get(
-                    params.url,
-                    headers={
-                        "User-Agent": (
-                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                        ),
-                    },
-                ) as response,
-            ):
+            # Reuse pooled connections across fetches instead of a new session per call
+            async with get_shared_client_session().get(
+                params.url,
+                headers={
+                    "User-Agent": (
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                    ),
+                },
+            ) as response:
                 if response.status >= 400:
                     return builder.error(
                         (
@@ -55,11 +58,38 @@ class FetchURL(CallableTool2[Params]):
                         brief=f"HTTP {response.status} error",
                     )
 
-                resp_text = await response.text()
+                # Don't download bodies that are announced to be too large in the first place
+                if (
+                    response.content_length is not None
+                    and response.content_length > MAX_RESPONSE_BYTES
+                ):
+                    return builder.error(
+                        (
+                            f"The page is too large to fetch: {response.content_length} bytes, "
+                            f"while at most {MAX_RESPONSE_BYTES} bytes are allowed."
+                        ),
+                        brief="Response too large",
+                    )
+
+                # Stream the body so that huge pages (without a Content-Length) can't exhaust memory
+                body = bytearray()
+                truncated = False
+                async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                    body += chunk
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        del body[MAX_RESPONSE_BYTES:]
+                        truncated = True
+                        break
 
                 content_type = response.headers.get(aiohttp.hdrs.CONTENT_TYPE, "").lower()
                 if content_type.startswith(("text/plain", "text/markdown")):
-                    builder.write(resp_text)
+                    builder.write(_decode(body, response.charset))
+                    if truncated:
+                        return builder.ok(
+                            f"The returned content is the first {MAX_RESPONSE_BYTES} bytes "
+                            "of the page.",
+                            brief="Response truncated",
+                        )
                     return builder.ok("The returned content is the full content of the page.")
         except aiohttp.ClientError as e:
             return builder.error(
@@ -70,14 +100,17 @@ class FetchURL(CallableTool2[Params]):
                 brief="Network error",
             )
 
-        if not resp_text:
+        if not body:
             return builder.ok(
                 "The response body is empty.",
                 brief="Empty response body",
             )
 
-        extracted_text = trafilatura.extract(
-            resp_text,
+        # Extraction is CPU-bound and can take a while on large pages, keep it off the event loop.
+        # trafilatura detects the encoding of raw bytes itself, so the HTML is not decoded here.
+        extracted_text = await asyncio.to_thread(
+            trafilatura.extract,
+            bytes(body),
             include_comments=True,
             include_tables=True,
             include_formatting=False,
@@ -96,6 +129,17 @@ class FetchURL(CallableTool2[Params]):
             )
 
         builder.write(extracted_text)
+        if truncated:
+            return builder.ok(
+                "The returned content is the main text content extracted from the first "
+                f"{MAX_RESPONSE_BYTES} bytes of the page, the rest of the page was cut off.",
+                brief="Response truncated",
+            )
         return builder.ok("The returned content is the main text content extracted from the page.")
 
-    
\ No newline at end of file
+
+def _decode(body: bytes | bytearray, charset: str | None) -> str:
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:  # unknown charset declared by the server
+        return body.decode("utf-8", errors="replace")
@@ -1,20 +1,106 @@
+import asyncio
+import contextlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import override
-import os
 
+import aiohttp
+import orjson
 from duckduckgo_search import DDGS
-from kosong.tooling import CallableTool2, ToolReturnValue
+from kosong.tooling import CallableTool2, ToolError, ToolReturnValue
 from pydantic import BaseModel, Field, ValidationError
 
 from levi_cli.constant import USER_AGENT
+from levi_cli.share import get_share_dir
 from levi_cli.soul.toolset import get_current_tool_call_or_none
 from levi_cli.tools.utils import ToolResultBuilder, load_desc
-from levi_cli.utils.aiohttp import new_client_session
+from levi_cli.utils.aiohttp import get_shared_client_session
 from loguru import logger
 
+_TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_TAVILY_HEADERS = {"Content-Type": "application/json"}
+_TAVILY_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+_SEARCH_CACHE_SIZE = 128
+_SEARCH_CACHE_TTL = 3600.0
+"""Seconds for which successful search results are reused."""
+
+type _SearchKey = tuple[str, int, bool]
+_search_cache: OrderedDict[_SearchKey, tuple[float, ToolReturnValue]] = OrderedDict()
+_inflight_searches: dict[_SearchKey, asyncio.Task[ToolReturnValue]] = {}
+
+
+def _search_cache_get(key: _SearchKey) -> ToolReturnValue | None:
+    """Get a cached search result, if there is one that has not expired yet."""
+    if (entry := _search_cache.get(key)) is None:
+        return None
+    cached_at, ret = entry
+    if time.monotonic() - cached_at >= _SEARCH_CACHE_TTL:
+        del _search_cache[key]
+        return None
+    _search_cache.move_to_end(key)
+    return ret
+
+
+def _search_cache_put(key: _SearchKey, ret: ToolReturnValue) -> None:
+    """Cache a search result, evicting the least recently used ones beyond the size limit."""
+    _search_cache[key] = (time.monotonic(), ret)
+    _search_cache.move_to_end(key)
+    while len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+
+_DISK_CACHE_TTL = 24 * 3600.0
+"""Seconds for which successful search results are reused across CLI restarts."""
+
+
+def _disk_cache_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(get_share_dir() / "search_cache.sqlite", isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, ts REAL, payload BLOB)"
+    )
+    return conn
+
+
+def _disk_cache_get(key: _SearchKey) -> ToolReturnValue | None:
+    """Get a search result persisted by an earlier run, if it has not expired yet."""
+    try:
+        with contextlib.closing(_disk_cache_connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM search_cache WHERE key = ? AND ts > ?",
+                (orjson.dumps(key).decode(), time.time() - _DISK_CACHE_TTL),
+            ).fetchone()
+        return ToolReturnValue.model_validate_json(row[0]) if row else None
+    except (sqlite3.Error, OSError, ValidationError) as e:
+        logger.warning("Failed to read search cache: {error}", error=e)
+        return None
+
+
+def _disk_cache_put(key: _SearchKey, ret: ToolReturnValue) -> None:
+    """Persist a search result, dropping expired ones along the way."""
+    now = time.time()
+    try:
+        with contextlib.closing(_disk_cache_connect()) as conn:
+            conn.execute("DELETE FROM search_cache WHERE ts <= ?", (now - _DISK_CACHE_TTL,))
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, ts, payload) VALUES (?, ?, ?)",
+                (orjson.dumps(key).decode(), now, ret.model_dump_json().encode()),
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to write search cache: {error}", error=e)
+
+
+def _ddgs_text(query: str, limit: int) -> list[dict[str, str]]:
+    with DDGS() as ddgs:
+        return list(ddgs.text(keywords=query, max_results=limit))
+
 
 class Params(BaseModel):
-    query: str = Field(description="The query text to search for.")
+    query: str = Field(description="The query text to search for.", min_length=1)
     limit: int = Field(
         description=(
             "The number of results to return. "
@@ -44,11 +130,52 @@ class SearchWeb(CallableTool2[Params]):
     def __init__(self):
         super().__init__()
         self._tavily_api_key = os.getenv("TAVILY_API_KEY")
+        # 请求体中不随搜索变化的部分只构建一次
+        self._tavily_base_body = {
+            "api_key": self._tavily_api_key,
+            "include_answer": False,
+            "include_images": False,
+        }
         # 可以在这里配置 Tavily 或其他搜索服务
         
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
-    # 优先使用 Tavily
+        # 空白查询必然失败，不必浪费一次网络请求
+        if not params.query.strip():
+            return ToolError(
+                message="Query is empty. Please provide the text to search for.",
+                brief="Empty query",
+            )
+
+        # LLM 重试或重新规划时经常重复同样的搜索，直接复用之前的结果
+        key = (params.query, params.limit, params.include_content)
+        if (ret := _search_cache_get(key)) is not None:
+            logger.debug("Using cached search results for: {query}", query=params.query)
+            return ret
+
+        # 并发的相同搜索共用同一个请求；shield 保证某个调用被取消时不影响其他等待者
+        task = _inflight_searches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_and_cache(key, params))
+            _inflight_searches[key] = task
+            task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _search_and_cache(self, key: _SearchKey, params: Params) -> ToolReturnValue:
+        # 内存中没有时，先看之前运行时保存在磁盘上的结果
+        if (ret := await asyncio.to_thread(_disk_cache_get, key)) is not None:
+            logger.debug("Using persisted search results for: {query}", query=params.query)
+            _search_cache_put(key, ret)
+            return ret
+
+        ret = await self._search(params)
+        if not ret.is_error:
+            _search_cache_put(key, ret)
+            await asyncio.to_thread(_disk_cache_put, key, ret)
+        return ret
+
+    async def _search(self, params: Params) -> ToolReturnValue:
+        # 优先使用 Tavily
         if self._tavily_api_key:
             ret = await self._search_with_tavily(params)
             if not ret.is_error:
@@ -56,38 +183,31 @@ class SearchWeb(CallableTool2[Params]):
             logger.warning("Tavily search failed, falling back to DuckDuckGo")
         
         # 降级到 DuckDuckGo
-        return await self._search_with_ddgs(params)       
-        
+        return await self._search_with_ddgs(params)
 
     
     async def _search_with_tavily(self, params: Params) -> ToolReturnValue:
         """Search using Tavily API"""
-        builder = ToolResultBuilder(max_line_length=None)
-        
         if not self._tavily_api_key:
-            return builder.error(
-                "Tavily API key not found. Please set TAVILY_API_KEY environment variable.",
+            return ToolError(
+                message="Tavily API key not found. Please set TAVILY_API_KEY environment variable.",
                 brief="Tavily API key not configured",
             )
-        
+
+        builder = ToolResultBuilder(max_line_length=None)
         try:
-            async with (
-                new_client_session() as session,
-                session.post(
-                    "https://api.tavily.com/search",
-                    headers={
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "api_key": self._tavily_api_key,
-                        "query": params.query,
-                        "max_results": params.limit,
-                        "include_answer": False,
-                        "include_raw_content": params.include_content,
-                        "include_images": False,
-                    },
-                ) as response,
-            ):
+            # Reuse pooled keep-alive connections to Tavily across searches
+            async with get_shared_client_session().post(
+                _TAVILY_SEARCH_URL,
+                headers=_TAVILY_HEADERS,
+                json={
+                    **self._tavily_base_body,
+                    "query": params.query,
+                    "max_results": params.limit,
+                    "include_raw_content": params.include_content,
+                },
+                timeout=_TAVILY_TIMEOUT,
+            ) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     return builder.error(
@@ -95,7 +215,8 @@ class SearchWeb(CallableTool2[Params]):
                         brief=f"Tavily API error {response.status}",
                     )
                 
-                result = await response.json()
+                # Raw results can be large with `include_content`, parse the bytes with orjson
+                result = orjson.loads(await response.read())
                 
                 if "results" not in result or not result["results"]:
                     return builder.error(
@@ -103,23 +224,20 @@ class SearchWeb(CallableTool2[Params]):
                         brief="No results found",
                     )
                 
-                for i, item in enumerate(result["results"]):
-                    if i > 0:
-                        builder.write("---\n\n")
-                    
-                    title = item.get("title", "N/A")
-                    url = item.get("url", "N/A")
-                    snippet = item.get("content", "N/A")
-                    
-                    builder.write(
-                        f"Title: {title}\n"
-                        f"URL: {url}\n"
-                        f"Summary: {snippet}\n\n"
+                # Format all results first and write them at once
+                parts: list[str] = []
+                for item in result["results"]:
+                    get = item.get
+                    part = (
+                        f"Title: {get('title', 'N/A')}\n"
+                        f"URL: {get('url', 'N/A')}\n"
+                        f"Summary: {get('content', 'N/A')}\n\n"
                     )
-                    
-                    if params.include_content and item.get("raw_content"):
-                        builder.write(f"{item['raw_content']}\n\n")
-                
+                    if params.include_content and (raw_content := get("raw_content")):
+                        part += f"{raw_content}\n\n"
+                    parts.append(part)
+                builder.write("---\n\n".join(parts))
+
                 return builder.ok()
                 
         except Exception as e:
@@ -142,12 +260,9 @@ class SearchWeb(CallableTool2[Params]):
                 "full page content not available. Snippets only.]\n\n"
             )
         try:
-            # Use DuckDuckGo search (synchronous API called in async context)
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    keywords=params.query,
-                    max_results=params.limit,
-                ))
+            # DDGS only has a synchronous API, run it in a worker thread to not block the event
+            # loop for the whole search
+            results = await asyncio.to_thread(_ddgs_text, params.query, params.limit)
 
             if not results:
                 return builder.error(
@@ -155,20 +270,15 @@ class SearchWeb(CallableTool2[Params]):
                     brief="No results found",
                 )
 
-            # Format results consistently
-            for i, result in enumerate(results):
-                if i > 0:
-                    builder.write("---\n\n")
-                
-                title = result.get("title", "N/A")
-                url = result.get("href", "N/A")
-                body = result.get("body", "N/A")
-                
-                builder.write(
-                    f"Title: {title}\n"
-                    f"URL: {url}\n"
-                    f"Summary: {body}\n\n"
+            # Format results consistently, and write them at once
+            builder.write(
+                "---\n\n".join(
+                    f"Title: {result.get('title', 'N/A')}\n"
+                    f"URL: {result.get('href', 'N/A')}\n"
+                    f"Summary: {result.get('body', 'N/A')}\n\n"
+                    for result in results
                 )
+            )
 
             return builder.ok()
 
@@ -61,6 +61,8 @@ class MetaCommand:
 _meta_commands: dict[str, MetaCommand] = {}
 # primary name or alias -> MetaCommand
 _meta_command_aliases: dict[str, MetaCommand] = {}
+# rendered by `help` on first use, reset whenever a meta command is registered
+_help_panel: Panel | None = None
 
 
 def get_meta_command(name: str) -> MetaCommand | None:
@@ -112,6 +114,7 @@ def meta_command(
     """
 
     def _register(f: MetaCmdFunc):
+        global _help_panel
         primary = name or f.__name__
         alias_list = list(aliases) if aliases else []
 
@@ -124,13 +127,10 @@ def meta_command(
             levi_soul_only=levi_soul_only,
         )
 
-        # Register primary command
+        # Register primary command, and the primary name and aliases pointing to it
         _meta_commands[primary] = cmd
-        _meta_command_aliases[primary] = cmd
-
-        # Register aliases pointing to the same command
-        for alias in alias_list:
-            _meta_command_aliases[alias] = cmd
+        _meta_command_aliases.update(dict.fromkeys((primary, *alias_list), cmd))
+        _help_panel = None
 
         return f
 
@@ -163,8 +163,9 @@ Meta commands are also available:
 @meta_command(aliases=["h", "?"])
 def help(app: Shell, args: list[str]):
     """Show help information"""
-    console.print(
-        Panel(
+    global _help_panel
+    if _help_panel is None:
+        _help_panel = Panel(
             _HELP_MESSAGE_FMT.format(
                 meta_commands_md="\n".join(
                     f" • {command.slash_name()}: {command.description}"
@@ -176,7 +177,7 @@ def help(app: Shell, args: list[str]):
             expand=False,
             padding=(1, 2),
         )
-    )
+    console.print(_help_panel)
 
 
 @meta_command
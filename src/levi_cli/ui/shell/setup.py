@@ -16,7 +16,7 @@ from levi_cli.config import (
 )
 from levi_cli.ui.shell.console import console
 from levi_cli.ui.shell.metacmd import meta_command
-from levi_cli.utils.aiohttp import new_client_session
+from levi_cli.utils.aiohttp import get_shared_client_session
 
 if TYPE_CHECKING:
     from levi_cli.ui.shell import Shell
@@ -25,7 +25,7 @@ class _Platform(NamedTuple):
     id: str
     name: str
     base_url: str
-    allowed_prefixes: list[str] | None = None
+    allowed_prefixes: tuple[str, ...] | None = None
 
 
 _PLATFORMS = [
@@ -34,7 +34,13 @@ _PLATFORMS = [
         id="qwen-dashscope",
         name="Qwen (Aliyun DashScope)",
         base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
-        allowed_prefixes=["qwen-flash", "qwen-image-max", "qwen-plus", "qwen3-vl-plus", "qwen3-omni-flash"],
+        allowed_prefixes=(
+            "qwen-flash",
+            "qwen-image-max",
+            "qwen-plus",
+            "qwen3-vl-plus",
+            "qwen3-omni-flash",
+        ),
     ),
     # 2. DeepSeek (官方 API)
     _Platform(
@@ -147,16 +153,13 @@ async def _setup() -> _SetupResult | None:
     # list models
     models_url = f"{platform.base_url}/models"
     try:
-        async with (
-            new_client_session() as session,
-            session.get(
-                models_url,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                },
-                raise_for_status=True,
-            ) as response,
-        ):
+        async with get_shared_client_session().get(
+            models_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+            },
+            raise_for_status=True,
+        ) as response:
             resp_json = await response.json()
     except aiohttp.ClientError as e:
         console.print(f"[red]Failed to get models: {e}[/red]")
@@ -168,9 +171,7 @@ async def _setup() -> _SetupResult | None:
     model_ids: list[str] = [model["id"] for model in resp_json["data"]]
     if platform.allowed_prefixes is not None:
         model_ids = [
-            model_id
-            for model_id in model_ids
-            if model_id.startswith(tuple(platform.allowed_prefixes))
+            model_id for model_id in model_ids if model_id.startswith(platform.allowed_prefixes)
         ]
 
     if not model_ids:
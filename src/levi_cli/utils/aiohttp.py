@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import ssl
 
 import aiohttp
@@ -7,6 +8,47 @@ import certifi
 
 _ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+_shared_session: aiohttp.ClientSession | None = None
+_shared_session_loop: asyncio.AbstractEventLoop | None = None
+
 
 def new_client_session() -> aiohttp.ClientSession:
     return aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=_ssl_context))
+
+
+def get_shared_client_session() -> aiohttp.ClientSession:
+    """
+    Get a client session shared across calls, so that DNS results, connections and TLS sessions
+    to the same host are reused instead of being set up again for every request.
+
+    Cookies are not kept, so that sharing the session doesn't leak cookies set by one response
+    into later requests, just like with a new session per request.
+
+    The session is created lazily on the running event loop, and recreated if it has been
+    closed or belongs to another loop. It must not be used as a context manager; call
+    `close_shared_client_session` before the event loop shuts down instead.
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=_ssl_context,
+                limit=32,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_client_session() -> None:
+    """Close the shared client session, if it has been created on the running event loop."""
+    global _shared_session, _shared_session_loop
+    if _shared_session is not None and _shared_session_loop is asyncio.get_running_loop():
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from levi_cli.tools.web.fetch import FetchURL, Params
+from levi_cli.utils.aiohttp import close_shared_client_session, get_shared_client_session
+
+
+async def _set_cookie(request: web.Request) -> web.Response:
+    response = web.Response(text="ok", content_type="text/plain")
+    response.set_cookie("sid", "secret123")
+    return response
+
+
+async def _echo_cookie(request: web.Request) -> web.Response:
+    return web.Response(text=request.headers.get("Cookie", "<none>"), content_type="text/plain")
+
+
+@pytest_asyncio.fixture
+async def server_url() -> AsyncIterator[str]:
+    app = web.Application()
+    app.router.add_get("/set", _set_cookie)
+    app.router.add_get("/echo", _echo_cookie)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pyright: ignore[reportOptionalMemberAccess]
+    try:
+        yield f"http://localhost:{port}"
+    finally:
+        await close_shared_client_session()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_shared_session_is_reused():
+    try:
+        assert get_shared_client_session() is get_shared_client_session()
+    finally:
+        await close_shared_client_session()
+
+
+@pytest.mark.asyncio
+async def test_shared_session_does_not_keep_cookies(server_url: str):
+    session = get_shared_client_session()
+    async with session.get(f"{server_url}/set") as response:
+        assert response.cookies["sid"].value == "secret123"
+    async with session.get(f"{server_url}/echo") as response:
+        assert await response.text() == "<none>"
+    assert len(session.cookie_jar) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_does_not_replay_cookies(server_url: str):
+    await FetchURL()(Params(url=f"{server_url}/set"))
+    result = await FetchURL()(Params(url=f"{server_url}/echo"))
+    assert result.output == "<none>"
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import orjson
+import pytest
+from typer.testing import CliRunner
+
+from levi_cli.cli import cli
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path
+
+
+def test_mcp_add_stdio_forwards_args_after_double_dash(home: Path):
+    result = CliRunner().invoke(
+        cli,
+        ["mcp", "add", "--transport", "stdio", "chrome", "--", "npx", "-y", "pkg@latest"],
+    )
+    assert result.exit_code == 0, result.output
+
+    config = orjson.loads((home / ".levi" / "mcp.json").read_bytes())
+    assert config["mcpServers"]["chrome"]["command"] == "npx"
+    assert config["mcpServers"]["chrome"]["args"] == ["-y", "pkg@latest"]
+
+
+def test_mcp_help_is_forwarded(home: Path):
+    result = CliRunner().invoke(cli, ["mcp", "--help"])
+    assert result.exit_code == 0, result.output
+    assert "add" in result.output
@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from levi_cli.tools.file.glob import _scandir_glob
+
+PATTERNS = [
+    "*",
+    "*/",
+    ".*",
+    "*.py",
+    "*.txt",
+    "?.txt",
+    "[ab]*",
+    "[!a]*",
+    "src/*",
+    "src/*/",
+    "src/*.py",
+    "src/**",
+    "src/**/",
+    "src/**/*",
+    "src/**/*.py",
+    "src/**/**/*.py",
+    "src/**/pkg",
+    "src/**/pkg/",
+    "src/**/.*",
+    "src/pkg/__init__.py",
+    "src/pkg",
+    "src/pkg/",
+    "src/missing/*",
+    "src/*/*",
+    "src/*/*.py",
+    "./src/*.py",
+    "src/./pkg/*",
+    "src/pkg/../*.py",
+    "src/../*",
+    "./**",
+    ".hidden/**",
+    "link_dir/*",
+    "link_dir/**",
+    "link_dir/**/*.py",
+    "*link*",
+    "a.txt",
+    "a.txt/",
+    "a.txt/*",
+    "missing",
+    "*/*/*",
+    "docs/**/*.md",
+]
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for path in [
+        "a.txt",
+        "b.txt",
+        "c.py",
+        ".env",
+        ".hidden/secret.txt",
+        ".hidden/nested/deep.py",
+        "src/main.py",
+        "src/util.py",
+        "src/.cache",
+        "src/pkg/__init__.py",
+        "src/pkg/mod.py",
+        "src/pkg/sub/pkg/inner.py",
+        "src/.private/x.py",
+        "docs/guide/intro.md",
+        "docs/readme.md",
+    ]:
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("")
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "link_dir").symlink_to(tmp_path / "src", target_is_directory=True)
+    (tmp_path / "link_file.py").symlink_to(tmp_path / "c.py")
+    (tmp_path / "broken_link").symlink_to(tmp_path / "nowhere")
+    (tmp_path / "src" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    return tmp_path
+
+
+def _path_glob(root: Path, pattern: str, include_dirs: bool) -> list[str]:
+    return sorted(
+        str(path.relative_to(root))
+        for path in root.glob(pattern)
+        if include_dirs or path.is_file()
+    )
+
+
+@pytest.mark.parametrize("include_dirs", [True, False])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_matches_path_glob(tree: Path, pattern: str, include_dirs: bool):
+    assert sorted(_scandir_glob(str(tree), pattern, include_dirs)) == _path_glob(
+        tree, pattern, include_dirs
+    )
+
+
+def test_trailing_double_star_reports_root_as_dot(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "b.txt").write_text("")
+
+    assert sorted(_scandir_glob(str(tmp_path), "./**", True)) == [".", "a", "a/b.txt"]
+    assert sorted(_scandir_glob(str(tmp_path), "a/**", True)) == ["a", "a/b.txt"]
+
+
+def test_missing_root(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        _scandir_glob(str(tmp_path / "missing"), "*", True)
+
+
+def test_root_is_not_a_directory(tmp_path: Path):
+    (tmp_path / "a.txt").write_text("")
+    with pytest.raises(NotADirectoryError):
+        _scandir_glob(str(tmp_path / "a.txt"), "*", True)
+
+
+@pytest.mark.parametrize("pattern", ["", ".", "./", os.sep + "abs"])
+def test_unacceptable_patterns(tmp_path: Path, pattern: str):
+    with pytest.raises(ValueError):
+        _scandir_glob(str(tmp_path), pattern, True)
@@ -0,0 +1,119 @@
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+from levi_cli.tools.file import grep_local
+from levi_cli.tools.file.grep_local import Grep, Params, _read_head
+
+requires_rg = pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep is not installed")
+
+
+def _stream(data: bytes, chunk_size: int) -> asyncio.StreamReader:
+    stream = asyncio.StreamReader()
+    for i in range(0, len(data), chunk_size):
+        stream.feed_data(data[i : i + chunk_size])
+    stream.feed_eof()
+    return stream
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+@pytest.mark.parametrize("max_lines", [1, 2, 5, 9, 10, 11, 100])
+async def test_read_head(monkeypatch: pytest.MonkeyPatch, chunk_size: int, max_lines: int):
+    monkeypatch.setattr(grep_local, "_READ_CHUNK_SIZE", chunk_size)
+    lines = [f"line {i}\n".encode() for i in range(10)]
+    data = b"".join(lines)
+
+    head, stopped_early = await _read_head(_stream(data, chunk_size), max_lines)
+
+    if max_lines < len(lines):
+        assert stopped_early
+        assert head == b"".join(lines[:max_lines])
+    else:
+        # Reaching the last newline counts as stopping early when exactly max_lines are read
+        assert stopped_early == (max_lines == len(lines))
+        assert head == data
+
+
+@pytest.mark.asyncio
+async def test_read_head_without_trailing_newline():
+    head, stopped_early = await _read_head(_stream(b"a\nb\nc", 2), 5)
+    assert (head, stopped_early) == (b"a\nb\nc", False)
+
+    head, stopped_early = await _read_head(_stream(b"a\nb\nc", 2), 2)
+    assert (head, stopped_early) == (b"a\nb\n", True)
+
+
+@pytest.mark.asyncio
+async def test_read_head_empty():
+    assert await _read_head(_stream(b"", 1), 3) == (b"", False)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "big.txt").write_text(
+        "".join(f"{'match' if i % 3 == 0 else 'other'} {i}\n" for i in range(300))
+    )
+    for i in range(20):
+        (tmp_path / f"file_{i}.txt").write_text(f"match in file {i}\nother\nmatch again\n")
+    return tmp_path
+
+
+def _head(output: str, head_limit: int) -> str:
+    """Apply `head_limit` to unlimited output the way the Grep tool does."""
+    lines = output.split("\n")
+    if len(lines) > head_limit:
+        output = "\n".join(lines[:head_limit])
+        output += f"\n... (results truncated to {head_limit} lines)"
+    return output
+
+
+@requires_rg
+@pytest.mark.asyncio
+@pytest.mark.parametrize("head_limit", [1, 5, 100, 101, 1000])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"output_mode": "content"},
+        {"output_mode": "content", "-n": True},
+        {"output_mode": "content", "-C": 1},
+        {"output_mode": "count_matches"},
+        {"output_mode": "files_with_matches"},
+    ],
+)
+async def test_head_limit_on_single_file(tree: Path, options: dict, head_limit: int):
+    path = str(tree / "big.txt")
+    full = await Grep()(Params(pattern="match", path=path, **options))
+    limited = await Grep()(Params(pattern="match", path=path, head_limit=head_limit, **options))
+
+    assert limited.output == _head(str(full.output), head_limit)
+
+
+@requires_rg
+@pytest.mark.asyncio
+@pytest.mark.parametrize("head_limit", [1, 7, 19, 20, 21, 200])
+@pytest.mark.parametrize("output_mode", ["content", "files_with_matches", "count_matches"])
+async def test_head_limit_on_directory(tree: Path, output_mode: str, head_limit: int):
+    # ripgrep searches files in parallel, so only the number of lines and the lines themselves
+    # can be compared, not their order
+    full = await Grep()(Params(pattern="match", path=str(tree), output_mode=output_mode))
+    limited = await Grep()(
+        Params(pattern="match", path=str(tree), output_mode=output_mode, head_limit=head_limit)
+    )
+
+    full_lines = str(full.output).split("\n")
+    limited_lines = str(limited.output).split("\n")
+    if len(full_lines) > head_limit:
+        assert limited_lines[-1] == f"... (results truncated to {head_limit} lines)"
+        limited_lines = limited_lines[:-1]
+    assert len(limited_lines) == min(len(full_lines), head_limit)
+    assert set(limited_lines) <= set(full_lines)
+
+
+@requires_rg
+@pytest.mark.asyncio
+async def test_head_limit_no_matches(tree: Path):
+    result = await Grep()(Params(pattern="nothing-like-this", path=str(tree), head_limit=3))
+    assert result.message == "No matches found."
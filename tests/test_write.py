@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+from kosong.tooling import ToolError, ToolOk
+
+from levi_cli.soul.agent import BuiltinSystemPromptArgs
+from levi_cli.soul.approval import Approval
+from levi_cli.tools.file.write import Params, WriteFile
+
+
+class RecordingApproval(Approval):
+    def __init__(self):
+        super().__init__(yolo=True)
+        self.requests: list[str] = []
+
+    async def request(self, sender: str, action: str, description: str) -> bool:
+        self.requests.append(description)
+        return True
+
+
+def _write_file(work_dir: Path, approval: Approval) -> WriteFile:
+    return WriteFile(
+        BuiltinSystemPromptArgs(
+            LEVI_NOW="", LEVI_WORK_DIR=work_dir, LEVI_WORK_DIR_LS="", LEVI_AGENTS_MD=""
+        ),
+        approval,
+    )
+
+
+@pytest.mark.asyncio
+async def test_missing_parent_is_rejected_before_approval(tmp_path: Path):
+    approval = RecordingApproval()
+    result = await _write_file(tmp_path, approval)(
+        Params(path=str(tmp_path / "missing" / "a.txt"), content="hello")
+    )
+    assert isinstance(result, ToolError)
+    assert result.brief == "Parent directory not found"
+    assert approval.requests == []
+
+
+@pytest.mark.asyncio
+async def test_overwrite_and_append(tmp_path: Path):
+    approval = RecordingApproval()
+    tool = _write_file(tmp_path, approval)
+    path = tmp_path / "a.txt"
+
+    result = await tool(Params(path=str(path), content="héllo\n"))
+    assert isinstance(result, ToolOk)
+    assert "Current size: 7 bytes." in result.message
+
+    result = await tool(Params(path=str(path), content="world\n", mode="append"))
+    assert isinstance(result, ToolOk)
+    assert "Current size: 13 bytes." in result.message
+    assert path.read_text(encoding="utf-8") == "héllo\nworld\n"
+    assert len(approval.requests) == 2